@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Final
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
@@ -11,45 +12,53 @@ from .const import (
     CONF_KOD,
     CONF_LAT,
     CONF_LON,
-    CONF_SCAN_INTERVAL,
     CONF_SETTLEMENT,
     CONF_SETTLEMENT_NAME,
-    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
 )
-from .coordinator import MetHuForecastCoordinator
+from .coordinator import (
+    STORE_CACHE,
+    MetHuConfigEntry,
+    MetHuForecastCoordinator,
+    get_store,
+)
+from .helpers import async_close_session, resolve_scan_interval
 from .scraper import Settlement
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor", "weather"]
+PLATFORMS: Final[tuple[str, ...]] = ("sensor", "weather")
 
+# hass.data[DOMAIN] key holding entry_id → (settlement data, Settlement)
+SETTLEMENT_CACHE = "_settlements"
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up HungaroMet Forecast from a config entry."""
-    # Reconstruct the Settlement object from stored config data
-    settlement = Settlement(
-        name=entry.data.get(CONF_SETTLEMENT_NAME) or entry.data[CONF_SETTLEMENT],
-        kod=entry.data[CONF_KOD],
-        lat=float(entry.data[CONF_LAT]),
-        lon=float(entry.data[CONF_LON]),
-    )
 
-    scan_interval = entry.options.get(
-        CONF_SCAN_INTERVAL,
-        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-    )
+async def async_setup_entry(hass: HomeAssistant, entry: MetHuConfigEntry) -> bool:
+    """Set up HungaroMet Forecast from a config entry."""
+    settlement = _get_settlement(hass, entry)
 
-    coordinator = MetHuForecastCoordinator(hass, settlement, scan_interval)
+    scan_interval = resolve_scan_interval(entry)
 
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = MetHuForecastCoordinator(
+        hass, settlement, scan_interval, entry.entry_id
+    )
 
-    if not coordinator.data:
-        raise ConfigEntryNotReady(
-            f"Could not fetch initial forecast data for '{settlement.name}'"
+    if await coordinator.async_load_cached():
+        # A recent forecast is on disk; don't gate startup on met.hu
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            f"{DOMAIN}_{settlement.name}_refresh",
         )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+        if not coordinator.data:
+            raise ConfigEntryNotReady(
+                f"Could not fetch initial forecast data for '{settlement.name}'"
+            )
+
+    entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -57,14 +66,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: MetHuConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        await entry.runtime_data.async_flush_cache()
+        if not _session_in_use(hass, entry):
+            await async_close_session(hass)
     return unload_ok
 
 
+def _session_in_use(hass: HomeAssistant, unloading: ConfigEntry) -> bool:
+    """Whether anything besides the unloading entry may still use the session."""
+    return any(
+        other.state is not ConfigEntryState.NOT_LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != unloading.entry_id
+    ) or bool(hass.config_entries.flow.async_progress_by_handler(DOMAIN))
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the cached settlement and forecast of a removed config entry."""
+    hass.data.get(DOMAIN, {}).get(SETTLEMENT_CACHE, {}).pop(entry.entry_id, None)
+    # Through the entry's own Store, which also cancels any write it still has queued
+    await get_store(hass, entry.entry_id).async_remove()
+    hass.data[DOMAIN][STORE_CACHE].pop(entry.entry_id, None)
+
+
+def _get_settlement(hass: HomeAssistant, entry: ConfigEntry) -> Settlement:
+    """
+    Return the Settlement for a config entry.
+
+    The instance is kept across reloads and only rebuilt when the stored
+    settlement data changes.
+    """
+    key = (
+        entry.data.get(CONF_SETTLEMENT_NAME) or entry.data[CONF_SETTLEMENT],
+        entry.data[CONF_KOD],
+        entry.data[CONF_LAT],
+        entry.data[CONF_LON],
+    )
+    cache = hass.data.setdefault(DOMAIN, {}).setdefault(SETTLEMENT_CACHE, {})
+    cached = cache.get(entry.entry_id)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Reconstruct the Settlement object from stored config data
+    name, kod, lat, lon = key
+    settlement = Settlement(name=name, kod=kod, lat=float(lat), lon=float(lon))
+    cache[entry.entry_id] = (key, settlement)
+    return settlement
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update → reload."""
     await hass.config_entries.async_reload(entry.entry_id)
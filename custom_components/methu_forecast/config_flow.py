@@ -1,13 +1,13 @@
 """Config flow for HungaroMet (met.hu) Forecast integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_KOD,
@@ -18,19 +18,26 @@ from .const import (
     CONF_SETTLEMENT_NAME,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
 )
+from .helpers import async_get_session, resolve_scan_interval
 from .scraper import Settlement, lookup_settlement
 
 _LOGGER = logging.getLogger(__name__)
 
+# normalized name → lookup currently in progress, shared by concurrent callers
+_INFLIGHT: dict[str, asyncio.Task[Settlement | None]] = {}
+
+_SCAN_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL)
+)
+
 # Schema for step 1: user types a settlement name
 STEP_USER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SETTLEMENT): str,
-        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=1440)
-        ),
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
     }
 )
 
@@ -45,16 +52,34 @@ STEP_MANUAL_SCHEMA = vol.Schema(
 
 OPTIONS_SCHEMA = vol.Schema(
     {
-        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=1440)
-        ),
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): _SCAN_INTERVAL_VALIDATOR,
     }
 )
 
 
+async def _shared_lookup(
+    session: aiohttp.ClientSession, name: str
+) -> Settlement | None:
+    """
+    Resolve a settlement name, sharing an in-progress lookup of the same name.
+
+    lookup_settlement itself caches resolved settlements.
+    """
+    key = name.strip().casefold()
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(lookup_settlement(session, name))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shielded so one cancelled flow doesn't abort the lookup for the others
+    return await asyncio.shield(task)
+
+
 class MetHuForecastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for HungaroMet Forecast."""
 
+    __slots__ = ("_settlement_input", "_scan_interval")
+
     VERSION = 1
 
     def __init__(self) -> None:
@@ -73,20 +98,30 @@ class MetHuForecastConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            self._settlement_input = user_input[CONF_SETTLEMENT].strip()
+            name = user_input[CONF_SETTLEMENT].strip()
+            self._settlement_input = name
             self._scan_interval = user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
             # Prevent duplicates
-            await self.async_set_unique_id(self._settlement_input.lower())
+            await self.async_set_unique_id(name.casefold())
             self._abort_if_unique_id_configured()
 
-            session = async_get_clientsession(self.hass)
-
             try:
-                settlement = await lookup_settlement(session, self._settlement_input)
-            except aiohttp.ClientConnectorError:
+                settlement = await _shared_lookup(
+                    async_get_session(self.hass), self._settlement_input
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError):
                 errors["base"] = "cannot_connect"
                 settlement = None
+            except ValueError as exc:
+                # Autocomplete answered with something that isn't JSON
+                _LOGGER.warning(
+                    "Invalid autocomplete response for '%s': %s",
+                    self._settlement_input,
+                    exc,
+                )
+                errors["base"] = "invalid_response"
+                settlement = None
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception(
                     "Unexpected error looking up settlement '%s'",
@@ -171,18 +206,15 @@ class MetHuForecastOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL,
-            self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-        )
+        current_interval = resolve_scan_interval(self.config_entry)
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
-                    vol.Optional(CONF_SCAN_INTERVAL, default=current_interval): vol.All(
-                        vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL, max=1440)
-                    ),
+                    vol.Optional(
+                        CONF_SCAN_INTERVAL, default=current_interval
+                    ): _SCAN_INTERVAL_VALIDATOR,
                 }
             ),
         )
@@ -1,6 +1,9 @@
 """Constants for the HungaroMet (met.hu) Forecast integration."""
+from __future__ import annotations
 
-DOMAIN = "methu_forecast"
+import sys
+
+DOMAIN = sys.intern("methu_forecast")
 
 CONF_SETTLEMENT = "settlement"       # user-visible settlement name (for display)
 CONF_SETTLEMENT_NAME = "settlement_name"  # resolved canonical name from autocomplete
@@ -11,6 +14,9 @@ CONF_SCAN_INTERVAL = "scan_interval"
 
 DEFAULT_SCAN_INTERVAL = 60  # minutes
 MIN_SCAN_INTERVAL = 30
+MAX_SCAN_INTERVAL = 1440
+SCAN_INTERVAL_BACKOFF = 1.5  # fetch spacing growth factor while the forecast is unchanged
+MAX_FETCH_INTERVAL = 360  # minutes; backoff cap, one 6-hourly forecast slot
 
 ATTR_SETTLEMENT = "settlement"
 ATTR_FORECAST_TIME = "forecast_time"
@@ -1,31 +1,125 @@
 """DataUpdateCoordinator for HungaroMet (met.hu) Forecast."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import random
+import time
+from dataclasses import asdict, astuple, fields
+from datetime import datetime, timedelta
+from operator import attrgetter
+from typing import Any
 
 import aiohttp
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .scraper import MetHuForecastData, Settlement, fetch_forecast
+from .const import (
+    CONF_KOD,
+    CONF_LAT,
+    CONF_LON,
+    DOMAIN,
+    MAX_FETCH_INTERVAL,
+    SCAN_INTERVAL_BACKOFF,
+)
+from .helpers import async_get_session
+from .scraper import (
+    CachedResponse,
+    ForecastPeriod,
+    MetHuForecastData,
+    Settlement,
+    fetch_forecast,
+    lookup_settlement,
+    refresh_current,
+    to_ha_condition,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10  # seconds; coalesces writes of back-to-back updates
+# hass.data[DOMAIN] key holding entry_id → forecast Store
+STORE_CACHE = "_stores"
+
+# Transient HTTP statuses worth retrying within a single update
+RETRY_STATUSES = (429, 502, 503, 504)
+RETRY_ATTEMPTS = 3
+MAX_RETRY_DELAY = 60  # seconds
+
+# A fetch due within this many seconds of a poll is done by that poll, so
+# timer jitter never costs a whole extra interval
+FETCH_SLACK = 60
+
+# ForecastPeriod fields exposed per sensor as forecast series
+_SERIES_KEYS = tuple(
+    f.name for f in fields(ForecastPeriod) if f.init and f.name != "forecast_time"
+)
+# Fetches all of a period's series values in one call, in _SERIES_KEYS order
+_series_values = attrgetter(*_SERIES_KEYS)
+
+# sensor key → (hourly series, daily series)
+ForecastSeries = dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]]
+
+# Settlement name → entity id slug, in one pass after lower()
+_SLUG_TABLE = str.maketrans({" ": "_", "-": "_"})
+
 
 class MetHuForecastCoordinator(DataUpdateCoordinator[MetHuForecastData]):
     """Coordinator to manage fetching data from met.hu."""
 
+    __slots__ = (
+        "settlement",
+        "slug",
+        "device_info",
+        "_base_interval",
+        "_interval",
+        "_next_fetch",
+        "_last_data_hash",
+        "_derived_for",
+        "_last_updated_iso",
+        "_series",
+        "_responses",
+        "_store",
+        "_pending_save",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         settlement: Settlement,
         scan_interval: int,
+        entry_id: str,
     ) -> None:
         """Initialize the coordinator."""
         self.settlement = settlement
+        # Shared by every entity of the entry
+        self.slug = settlement.name.lower().translate(_SLUG_TABLE)
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name=f"HungaroMet: {settlement.name}",
+            manufacturer="HungaroMet",
+            model="met.hu Forecast",
+            entry_type="service",
+            configuration_url=(
+                "https://www.met.hu/idojaras/elorejelzes/magyarorszagi_telepulesek/"
+            ),
+        )
+        self._base_interval = scan_interval
+        self._interval = scan_interval  # minutes between met.hu fetches
+        self._next_fetch = 0.0  # time.monotonic() before which polls skip met.hu
+        self._last_data_hash: int | None = None
+        # Values derived from self.data, rebuilt when the data object changes
+        self._derived_for: MetHuForecastData | None = None
+        self._last_updated_iso: str | None = None
+        self._series: ForecastSeries = {}
+        # kod → last met.hu response, dropped together with the coordinator
+        self._responses: dict[str, CachedResponse] = {}
+        self._store = get_store(hass, entry_id)
+        # (saved_at, data) waiting for the delayed Store write
+        self._pending_save: tuple[float, MetHuForecastData] | None = None
 
         super().__init__(
             hass,
@@ -34,15 +128,98 @@ class MetHuForecastCoordinator(DataUpdateCoordinator[MetHuForecastData]):
             update_interval=timedelta(minutes=scan_interval),
         )
 
-    async def _async_update_data(self) -> MetHuForecastData:
-        """Fetch data from met.hu."""
-        session = async_get_clientsession(self.hass)
+    async def async_load_cached(self) -> bool:
+        """
+        Seed the coordinator with the last persisted forecast.
+
+        Returns True if a forecast younger than the update interval was
+        found, in which case the first refresh need not block setup.
+        """
         try:
-            data = await fetch_forecast(session, self.settlement)
-        except aiohttp.ClientError as exc:
-            raise UpdateFailed(
-                f"Error communicating with met.hu for '{self.settlement.name}': {exc}"
-            ) from exc
+            stored = await self._store.async_load()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Could not load cached forecast for '%s'", self.settlement.name)
+            return False
+        if not stored:
+            return False
+
+        try:
+            age = time.time() - stored["ts"]
+            if age >= self.update_interval.total_seconds():
+                return False
+            data = _data_from_dict(stored["data"])
+        except (KeyError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Ignoring unreadable cached forecast: %s", exc)
+            return False
+
+        if not data.settlement_found:
+            return False
+
+        _LOGGER.debug(
+            "Using cached forecast for '%s' from %s", self.settlement.name, data.last_updated
+        )
+        self.data = data
+        self.last_update_success = True
+        return True
+
+    def forecast_series(
+        self, key: str
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Return the hourly and daily series of one ForecastPeriod field.
+
+        All series are pivoted out of the current data in one pass the first
+        time any sensor asks after an update, and then shared by all sensors
+        until the data object changes.
+        """
+        self._sync_derived()
+        return self._series.get(key, ([], []))
+
+    @property
+    def last_updated_iso(self) -> str | None:
+        """data.last_updated as an ISO string, formatted once per update."""
+        self._sync_derived()
+        return self._last_updated_iso
+
+    def _sync_derived(self) -> None:
+        data = self.data
+        if data is self._derived_for:
+            return
+        self._derived_for = data
+        self._series = _pivot_series(data) if data else {}
+        self._last_updated_iso = (
+            data.last_updated.isoformat() if data and data.last_updated else None
+        )
+
+    async def _async_update_data(self) -> MetHuForecastData:
+        """Fetch data from met.hu, or re-pick the current period while backed off."""
+        data = self.data
+        if data and data.settlement_found and time.monotonic() < self._next_fetch:
+            return refresh_current(data, datetime.now())
+
+        for attempt in range(RETRY_ATTEMPTS):
+            try:
+                data = await fetch_forecast(
+                    async_get_session(self.hass), self.settlement, self._responses
+                )
+                break
+            except aiohttp.ClientResponseError as exc:
+                if exc.status not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS - 1:
+                    raise UpdateFailed(
+                        f"Error communicating with met.hu for '{self.settlement.name}': {exc}"
+                    ) from exc
+                delay = _retry_delay(exc, attempt)
+                _LOGGER.debug(
+                    "met.hu answered %s for '%s', retrying in %.1f s",
+                    exc.status,
+                    self.settlement.name,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            except aiohttp.ClientError as exc:
+                raise UpdateFailed(
+                    f"Error communicating with met.hu for '{self.settlement.name}': {exc}"
+                ) from exc
 
         if not data.settlement_found:
             _LOGGER.warning(
@@ -50,5 +227,155 @@ class MetHuForecastCoordinator(DataUpdateCoordinator[MetHuForecastData]):
                 self.settlement.name,
                 self.settlement.kod,
             )
+            await self._async_reresolve()
+        else:
+            self._adapt_interval(data)
+            self._pending_save = (time.time(), data)
+            self._store.async_delay_save(self._take_pending_save, STORAGE_SAVE_DELAY)
 
         return data
+
+    async def async_flush_cache(self) -> None:
+        """Write a pending delayed save now, so none fires after unload."""
+        if self._pending_save is not None:
+            await self._store.async_save(self._take_pending_save())
+
+    def _take_pending_save(self) -> dict[str, Any]:
+        """Return the Store payload of the pending save and clear it."""
+        saved_at, data = self._pending_save
+        self._pending_save = None
+        return {"ts": saved_at, "data": asdict(data)}
+
+    async def _async_reresolve(self) -> None:
+        """
+        Look the settlement up again after met.hu stopped knowing its kod.
+
+        The settlement is otherwise resolved only once, in the config flow. If
+        met.hu now reports a different kod, the config entry is updated, which
+        reloads it with the new identifiers.
+        """
+        try:
+            # The cached answer is the kod that just failed; ask met.hu again
+            found = await lookup_settlement(
+                async_get_session(self.hass), self.settlement.name, force=True
+            )
+        except aiohttp.ClientError:
+            return
+        if found is None or found.kod == self.settlement.kod:
+            return
+        entry = self.config_entry
+        if entry is None:
+            return
+        _LOGGER.info(
+            "met.hu kod of '%s' changed from %s to %s",
+            self.settlement.name,
+            self.settlement.kod,
+            found.kod,
+        )
+        self._responses.pop(self.settlement.kod, None)
+        self.hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_KOD: found.kod,
+                CONF_LAT: found.lat,
+                CONF_LON: found.lon,
+            },
+        )
+
+    def _adapt_interval(self, data: MetHuForecastData) -> None:
+        """
+        Space out met.hu fetches while the forecast stays the same.
+
+        An unchanged forecast grows the fetch interval by SCAN_INTERVAL_BACKOFF
+        up to MAX_FETCH_INTERVAL (one forecast slot); any change drops back to
+        the configured value, which is also the floor. The coordinator itself
+        keeps polling at the configured interval, so the current period is
+        re-picked on time even while fetches are skipped.
+        """
+        data_hash = hash(tuple(astuple(p) for p in data.hourly))
+        if data_hash == self._last_data_hash:
+            interval = max(
+                self._base_interval,
+                min(MAX_FETCH_INTERVAL, round(self._interval * SCAN_INTERVAL_BACKOFF)),
+            )
+        else:
+            interval = self._base_interval
+        self._interval = interval
+        self._next_fetch = time.monotonic() + interval * 60 - FETCH_SLACK
+        self._last_data_hash = data_hash
+
+
+MetHuConfigEntry = ConfigEntry[MetHuForecastCoordinator]
+
+
+def _retry_delay(exc: aiohttp.ClientResponseError, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if given, else exponential backoff."""
+    retry_after = exc.headers.get("Retry-After") if exc.headers else None
+    try:
+        delay = float(retry_after) if retry_after else 0.0
+    except ValueError:
+        delay = 0.0  # HTTP-date form; fall back to backoff
+    if delay <= 0:
+        delay = 2**attempt + random.random()
+    return min(MAX_RETRY_DELAY, delay)
+
+
+def storage_key(entry_id: str) -> str:
+    """Return the Store key holding the cached forecast of a config entry."""
+    return f"{DOMAIN}.{entry_id}"
+
+
+def get_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """
+    Return the forecast Store of a config entry.
+
+    The instance is kept across reloads so that removing the entry goes
+    through the same Store that scheduled its writes.
+    """
+    stores = hass.data.setdefault(DOMAIN, {}).setdefault(STORE_CACHE, {})
+    store = stores.get(entry_id)
+    if store is None:
+        store = stores[entry_id] = Store(hass, STORAGE_VERSION, storage_key(entry_id))
+    return store
+
+
+def _pivot_series(data: MetHuForecastData) -> ForecastSeries:
+    """Turn the per-period rows into one (time, value) series per field."""
+    hourly: list[list[dict[str, Any]]] = [[] for _ in _SERIES_KEYS]
+    daily: list[list[dict[str, Any]]] = [[] for _ in _SERIES_KEYS]
+    for p in data.hourly:
+        iso = p.time_iso
+        for out, value in zip(hourly, _series_values(p)):
+            if value is not None:
+                out.append({"time": iso, "value": value})
+    for p in data.daily:
+        iso = p.date_iso
+        for out, value in zip(daily, _series_values(p)):
+            if value is not None:
+                out.append({"date": iso, "value": value})
+    return dict(zip(_SERIES_KEYS, zip(hourly, daily)))
+
+
+def _period_from_dict(raw: dict[str, Any]) -> ForecastPeriod:
+    period = ForecastPeriod(
+        **{f.name: raw.get(f.name) for f in fields(ForecastPeriod) if f.init}
+    )
+    if period.forecast_time:
+        period.forecast_time = datetime.fromisoformat(period.forecast_time)
+    period.stamp_iso()
+    period.ha_condition = to_ha_condition(period.weather_condition)
+    return period
+
+
+def _data_from_dict(raw: dict[str, Any]) -> MetHuForecastData:
+    current = raw.get("current")
+    last_updated = raw.get("last_updated")
+    return MetHuForecastData(
+        settlement=raw["settlement"],
+        settlement_found=raw["settlement_found"],
+        current=_period_from_dict(current) if current else None,
+        hourly=[_period_from_dict(p) for p in raw.get("hourly", [])],
+        daily=[_period_from_dict(p) for p in raw.get("daily", [])],
+        last_updated=datetime.fromisoformat(last_updated) if last_updated else None,
+    )
@@ -0,0 +1,64 @@
+"""Helpers shared by the HungaroMet (met.hu) Forecast setup and config flow."""
+from __future__ import annotations
+
+import aiohttp
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_context
+
+from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .scraper import create_session
+
+# hass.data[DOMAIN] key holding the integration's aiohttp session
+SESSION = "_session"
+# hass.data[DOMAIN] key holding the unsubscribe callback of its close listener
+SESSION_UNSUB = "_session_unsub"
+
+
+def resolve_scan_interval(entry: ConfigEntry) -> int:
+    """Return the update interval in minutes: options first, then initial data."""
+    return entry.options.get(
+        CONF_SCAN_INTERVAL,
+        entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+    )
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """
+    Return the met.hu session shared by all entries and config flows.
+
+    It is created on first use and closed when Home Assistant shuts down
+    or the last config entry is unloaded. Callers fetch it per use rather
+    than keeping it, so they never hold on to a closed session.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(SESSION)
+    if session is None or session.closed:
+        # HA's shared context; building one here would block the event loop
+        session = create_session(get_default_context())
+        domain_data[SESSION] = session
+
+        async def _async_close(_event: Event) -> None:
+            if domain_data.get(SESSION) is session:
+                # The listener has fired; there is nothing left to unsubscribe
+                domain_data.pop(SESSION_UNSUB, None)
+            await session.close()
+
+        if (unsub := domain_data.pop(SESSION_UNSUB, None)) is not None:
+            unsub()
+        domain_data[SESSION_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close
+        )
+    return session
+
+
+async def async_close_session(hass: HomeAssistant) -> None:
+    """Close the shared met.hu session, if one is open."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (unsub := domain_data.pop(SESSION_UNSUB, None)) is not None:
+        unsub()
+    session: aiohttp.ClientSession | None = domain_data.pop(SESSION, None)
+    if session is not None:
+        await session.close()
@@ -29,20 +29,53 @@ Column  CSS class(es)   Content
 10      td.Wf           Average wind speed [km/h]
 11      td.Wf           Wind gust speed [km/h]
 12      td.P            Sea-level pressure [hPa]
+
+Parsing
+-------
+Rows are extracted into parser-independent _Row/_Cell tuples, then turned
+into ForecastPeriods by shared code. Extraction uses selectolax's Lexbor
+backend when it is installed (the DOM stays in C) and BeautifulSoup with
+lxml or html.parser otherwise.
 """
 from __future__ import annotations
 
+import hashlib
 import logging
+import math
 import re
-from dataclasses import dataclass, field
+import ssl
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 import aiohttp
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+# Home Assistant ships orjson; the stdlib decoder is only a fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser, LexborNode
+except ImportError:  # the BeautifulSoup path is used instead
+    LexborHTMLParser = None
+    LexborNode = Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# lxml's C tokenizer is much faster than the stdlib one; fall back when absent
+try:
+    import lxml  # noqa: F401  pylint: disable=unused-import
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
 BASE_URL = "https://www.met.hu"
 AC_URL   = f"{BASE_URL}/jquery/search.php"
 MAIN_URL = f"{BASE_URL}/idojaras/elorejelzes/magyarorszagi_telepulesek/main.php"
@@ -54,6 +87,9 @@ HEADERS = {
         "Chrome/120.0.0.0 Safari/537.36"
     ),
     "Accept-Language": "hu-HU,hu;q=0.9,en;q=0.8",
+    # aiohttp decompresses these itself; "br" would need the optional
+    # Brotli package, so it is not advertised
+    "Accept-Encoding": "gzip, deflate",
     "Referer": f"{BASE_URL}/idojaras/elorejelzes/magyarorszagi_telepulesek/",
     "Origin": BASE_URL,
 }
@@ -87,6 +123,14 @@ HU_WIND_DIR = {
     "változó":       "variable",
 }
 
+# Intern the keys so lookups with interned text short-circuit on identity
+HU_MONTHS   = {sys.intern(k): v for k, v in HU_MONTHS.items()}
+HU_WIND_DIR = {sys.intern(k): v for k, v in HU_WIND_DIR.items()}
+
+# Case-folded views for input that doesn't match the keys above exactly
+_HU_MONTHS_CI   = {sys.intern(k.casefold()): v for k, v in HU_MONTHS.items()}
+_HU_WIND_DIR_CI = {sys.intern(k.casefold()): v for k, v in HU_WIND_DIR.items()}
+
 # met.hu icon code (from filename like w001.png, w002e.png) → HA condition
 ICON_CONDITION = {
     "w001":  "sunny",           # derült (nap)
@@ -129,12 +173,41 @@ ICON_CONDITION = {
     "w018e": "hail",
 }
 
+# Conditions Home Assistant's weather platform accepts; anything else maps to
+# "exceptional"
+VALID_HA_CONDITIONS = frozenset({
+    "clear-night", "cloudy", "exceptional", "fog", "hail", "lightning",
+    "lightning-rainy", "partlycloudy", "pouring", "rainy", "snowy",
+    "snowy-rainy", "sunny", "windy", "windy-variant",
+})
+
+
+# Cell text normalization for _parse_float: &nbsp; removed, unicode minus/dash → "-"
+_FLOAT_TRANS = str.maketrans({"\xa0": "", "−": "-", "–": "-"})
+
+# Patterns used per forecast cell, compiled once
+_RE_TIME     = re.compile(r"(\d{1,2}):(\d{2})")                 # "HH:MM"
+_RE_FLOAT    = re.compile(r"-?\d+\.?\d*")
+_RE_DECIMAL  = re.compile(r"-?\d+(?:\.\d+)?")
+_RE_ICON     = re.compile(r"/(w\d+e?)\.(?:png|gif|jpg)", re.I)  # icon code in img src
+_ICON_EXTS   = frozenset(("png", "gif", "jpg"))  # the suffixes _RE_ICON accepts
+_RE_KTEXT    = re.compile(r"class=ktext>([^<]+)<")              # tooltip description
+_RE_FOK      = re.compile(r"\((\d+)\s*fok\)")                  # "(341 fok)" bearing
+
+
+# Upper bound on simultaneous requests to met.hu across all settlements
+FETCH_CONCURRENCY = 4
+
+# The name → kod/lat/lon mapping practically never changes
+LOOKUP_CACHE_TTL = 86400  # seconds
+LOOKUP_CACHE_SIZE = 256
+
 
 # ---------------------------------------------------------------------------
 # Public data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settlement:
     """A Hungarian settlement with its met.hu identifiers."""
     name: str
@@ -143,7 +216,7 @@ class Settlement:
     lon:  float
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastPeriod:
     """One row from the met.hu forecast table (typically 6-hourly)."""
     forecast_time:             datetime | None = None
@@ -159,9 +232,20 @@ class ForecastPeriod:
     wind_bearing:              float | None = None  # degrees (0-360)
     wind_direction:            str   | None = None  # e.g. "NE"
     pressure:                  float | None = None  # hPa
+    # forecast_time as ISO strings, set once by stamp_iso() for the sensors
+    time_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    date_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    # weather_condition as a valid HA condition, set via to_ha_condition()
+    ha_condition: str = field(default="exceptional", init=False, repr=False, compare=False)
+
+    def stamp_iso(self) -> None:
+        """Refresh time_iso/date_iso from forecast_time."""
+        t = self.forecast_time
+        self.time_iso = t.isoformat() if t else None
+        self.date_iso = t.date().isoformat() if t else None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetHuForecastData:
     """All scraped forecast data for a settlement."""
     settlement:      str  = ""
@@ -172,16 +256,87 @@ class MetHuForecastData:
     last_updated:    datetime | None = None
 
 
+# case-folded name → (monotonic expiry time, resolved settlement)
+_LOOKUP_CACHE: dict[str, tuple[float, Settlement]] = {}
+
+
+class CachedResponse(NamedTuple):
+    """Body digest and parse result of the last forecast response for a kod."""
+    digest: bytes  # blake2b of the HTML body
+    data:   MetHuForecastData
+
+
+# ---------------------------------------------------------------------------
+# HTTP session
+# ---------------------------------------------------------------------------
+
+def create_session(ssl_context: ssl.SSLContext | None = None) -> aiohttp.ClientSession:
+    """
+    Create a pooled session for talking to met.hu.
+
+    Pass a prebuilt ssl_context when running inside an event loop; without
+    one aiohttp builds a default context, which loads certificates from disk.
+
+    All traffic goes to a single host, so a small keep-alive pool lets
+    successive requests skip the TCP and TLS handshakes. The session is
+    meant to outlive individual requests; the caller owns it and must
+    close it.
+
+    Every config entry has its own coordinator and they refresh
+    independently, so requests for several settlements already run
+    concurrently; the per-host limit is what keeps at most
+    FETCH_CONCURRENCY of them in flight against met.hu.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=10,
+            limit_per_host=FETCH_CONCURRENCY,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+            ssl=ssl_context if ssl_context is not None else True,
+        ),
+        headers=HEADERS,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Settlement lookup (autocomplete)
 # ---------------------------------------------------------------------------
 
 async def lookup_settlement(
-    session: aiohttp.ClientSession, name: str
+    session: aiohttp.ClientSession, name: str, *, force: bool = False
 ) -> Settlement | None:
     """
     Resolve a settlement name to its met.hu identifiers.
 
+    Resolved settlements are cached for LOOKUP_CACHE_TTL seconds, keyed on
+    the case-folded name; misses are not cached. ``force`` skips the cache
+    and asks met.hu, e.g. after a cached kod stopped working.
+
+    session must be the long-lived session from create_session(), never
+    one opened for this call, so the request can reuse a pooled connection.
+    """
+    key = name.strip().casefold()
+    if force:
+        _LOOKUP_CACHE.pop(key, None)
+    cached = _LOOKUP_CACHE.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+
+    settlement = await _autocomplete(session, name)
+    if settlement is not None:
+        _LOOKUP_CACHE.pop(key, None)
+        if len(_LOOKUP_CACHE) >= LOOKUP_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            _LOOKUP_CACHE.pop(next(iter(_LOOKUP_CACHE)))
+        _LOOKUP_CACHE[key] = (time.monotonic() + LOOKUP_CACHE_TTL, settlement)
+    return settlement
+
+
+async def _autocomplete(
+    session: aiohttp.ClientSession, name: str
+) -> Settlement | None:
+    """
     Calls GET /jquery/search.php?term=<name> which is the jQuery UI
     autocomplete source used on the page (visible in the page's JS).
     """
@@ -193,7 +348,7 @@ async def lookup_settlement(
             timeout=aiohttp.ClientTimeout(total=15),
         ) as resp:
             resp.raise_for_status()
-            data = await resp.json(content_type=None)
+            data = json_loads(await resp.read())
     except aiohttp.ClientError as exc:
         _LOGGER.error("Settlement autocomplete failed for '%s': %s", name, exc)
         raise
@@ -229,10 +384,17 @@ async def lookup_settlement(
 # ---------------------------------------------------------------------------
 
 async def fetch_forecast(
-    session: aiohttp.ClientSession, settlement: Settlement
+    session: aiohttp.ClientSession,
+    settlement: Settlement,
+    cache: dict[str, CachedResponse] | None = None,
 ) -> MetHuForecastData:
     """
     POST to main.php with c=tablazat and parse the returned HTML table.
+
+    session must be the long-lived session from create_session(), never
+    one opened for this call, so polls reuse a pooled connection.
+    cache, keyed by kod, holds the last response so an unchanged page is
+    not re-parsed; the caller owns it.
     """
     payload = {
         "srctext":    "",
@@ -247,6 +409,9 @@ async def fetch_forecast(
 
     _LOGGER.debug("Fetching forecast for %s (kod=%s)", settlement.name, settlement.kod)
 
+    # No If-None-Match/If-Modified-Since here: on a POST a compliant server
+    # answers a holding precondition with 412, so the body digest alone
+    # detects an unchanged page
     try:
         async with session.post(
             MAIN_URL,
@@ -255,32 +420,78 @@ async def fetch_forecast(
             timeout=aiohttp.ClientTimeout(total=30),
         ) as resp:
             resp.raise_for_status()
-            html = await resp.text(encoding="utf-8", errors="replace")
+            # Raw bytes go straight to the parser, which decodes them itself
+            html = await resp.read()
     except aiohttp.ClientError as exc:
-        _LOGGER.error("Forecast fetch failed for %s: %s", settlement.name, exc)
+        # The caller retries and reports the final failure
+        _LOGGER.debug("Forecast fetch failed for %s: %s", settlement.name, exc)
         raise
 
+    now = datetime.now()
+
     _LOGGER.debug("Received %d bytes for %s", len(html), settlement.name)
-    data = _parse_page(html, settlement.name)
-    data.last_updated = datetime.now()
+    digest = hashlib.blake2b(html, digest_size=16).digest()
+    cached = cache.get(settlement.kod) if cache is not None else None
+    if cached is not None and cached.digest == digest:
+        _LOGGER.debug("Forecast for %s unchanged, skipping parse", settlement.name)
+        data = _reuse(cached.data, now)
+    else:
+        data = _parse_page(html, settlement.name, now)
+        data.last_updated = now
+    if cache is not None:
+        cache[settlement.kod] = CachedResponse(digest, data)
     return data
 
 
+def refresh_current(data: MetHuForecastData, now: datetime) -> MetHuForecastData:
+    """
+    Re-pick the current period of already fetched data.
+
+    Returns ``data`` itself when the current period is still the same one.
+    """
+    current = _find_current(data.hourly, now)
+    if current is data.current:
+        return data
+    return replace(data, current=current)
+
+
+def _reuse(data: MetHuForecastData, now: datetime) -> MetHuForecastData:
+    """Return a fresh copy of an earlier parse; only the time-relative bits change."""
+    return replace(data, current=_find_current(data.hourly, now), last_updated=now)
+
+
 # ---------------------------------------------------------------------------
 # HTML parsing
 # ---------------------------------------------------------------------------
 
-def _parse_page(html: str, settlement_name: str) -> MetHuForecastData:
+class _Cell(NamedTuple):
+    """Parser-independent view of one <td> in a forecast row."""
+    classes:     tuple[str, ...]
+    text:        str         # stripped text content
+    onmouseover: str         # tooltip JS, "" if absent
+    img_src:     str | None  # src of the first <img> of an icon cell, else None
+
+
+class _Row(NamedTuple):
+    """One <tr> of the forecast <tbody>."""
+    naptar: list[str] | None  # <div> texts of th.naptar, if this row has one
+    cells:  list[_Cell]
+
+
+def _parse_page(html: bytes, settlement_name: str, now: datetime) -> MetHuForecastData:
     result = MetHuForecastData(settlement=settlement_name)
-    soup = BeautifulSoup(html, "html.parser")
 
-    tbody = soup.find("tbody")
-    if not tbody:
+    if LexborHTMLParser is not None:
+        rows = _extract_rows_lexbor(html)
+    else:
+        rows = _extract_rows_bs4(html)
+
+    if rows is None:
         _LOGGER.warning("No <tbody> found for '%s'", settlement_name)
         result.settlement_found = False
         return result
 
-    periods = _parse_tbody(tbody)
+    periods = _parse_rows(rows, now)
     if not periods:
         _LOGGER.warning("No forecast rows parsed for '%s'", settlement_name)
         result.settlement_found = False
@@ -289,42 +500,142 @@ def _parse_page(html: str, settlement_name: str) -> MetHuForecastData:
     result.settlement_found = True
     result.hourly  = periods
     result.daily   = _aggregate_daily(periods)
-    result.current = _find_current(periods)
+    result.current = _find_current(periods, now)
     return result
 
 
-def _parse_tbody(tbody: Tag) -> list[ForecastPeriod]:
+def _append_row(rows: list[_Row], naptar: list[str] | None, cells: list[_Cell]) -> None:
+    """Keep a row only if it holds a time cell or a date header."""
+    if any("ora" in c.classes for c in cells):
+        rows.append(_Row(naptar=naptar, cells=cells))
+    elif naptar is not None:
+        # A date header without data still sets the date for following rows
+        rows.append(_Row(naptar=naptar, cells=[]))
+
+
+def _extract_rows_lexbor(html: bytes) -> list[_Row] | None:
+    """Collect the forecast rows using selectolax's Lexbor backend."""
+    tree = LexborHTMLParser(html)
+
+    # Lexbor is an HTML5 parser and adds an implicit <tbody> to every table,
+    # so take the one that holds the first time cell rather than probing
+    # every tbody in turn.
+    tbody = _lexbor_ancestor(tree.css_first("td.ora"), "tbody") or tree.css_first("tbody")
+    if tbody is None:
+        return None
+
+    rows: list[_Row] = []
+    for tr in tbody.iter():
+        if tr.tag != "tr":
+            continue
+        # One walk over the row's own cells collects the date header and the
+        # data cells without descending into their contents
+        naptar: list[str] | None = None
+        cells: list[_Cell] = []
+        for node in tr.iter():
+            if node.tag == "td":
+                cells.append(_lexbor_cell(node))
+            elif (
+                naptar is None
+                and node.tag == "th"
+                and "naptar" in (node.attributes.get("class") or "").split()
+            ):
+                naptar = [d.text(strip=True) for d in node.css("div")]
+        _append_row(rows, naptar, cells)
+    return rows
+
+
+def _lexbor_ancestor(node: LexborNode | None, tag: str) -> LexborNode | None:
+    while node is not None and node.tag != tag:
+        node = node.parent
+    return node
+
+
+def _lexbor_cell(td: LexborNode) -> _Cell:
+    attrs = td.attributes
+    classes = tuple((attrs.get("class") or "").split())
+    img = td.css_first("img") if "idoikon" in classes else None
+    return _Cell(
+        classes=classes,
+        text=td.text(strip=True),
+        onmouseover=attrs.get("onmouseover") or "",
+        img_src=(img.attributes.get("src") or "") if img is not None else None,
+    )
+
+
+def _extract_rows_bs4(html: bytes) -> list[_Row] | None:
+    """Collect the forecast rows using BeautifulSoup (fallback backend)."""
+    soup = BeautifulSoup(html, BS4_PARSER, from_encoding="utf-8")
+
+    tbody = soup.find("tbody")
+    if not tbody:
+        return None
+
+    rows: list[_Row] = []
+    for tr in tbody.find_all("tr", recursive=False):
+        # One walk over the row's own cells collects the date header and the
+        # data cells without descending into their contents
+        naptar: list[str] | None = None
+        cells: list[_Cell] = []
+        for node in tr.find_all(("td", "th"), recursive=False):
+            if node.name == "td":
+                cells.append(_bs4_cell(node))
+            elif naptar is None and "naptar" in node.get("class", ()):
+                naptar = [_bs4_text(d) for d in node.find_all("div")]
+        _append_row(rows, naptar, cells)
+    return rows
+
+
+def _bs4_text(tag: Tag) -> str:
+    """get_text(strip=True) without building a list for single-string cells."""
+    string = tag.string
+    if type(string) is NavigableString:  # not a Comment or other subclass
+        return string.strip()
+    return "".join(tag.stripped_strings)
+
+
+def _bs4_cell(td: Tag) -> _Cell:
+    attrs = td.attrs
+    classes = tuple(attrs.get("class", ()))
+    img = None
+    if "idoikon" in classes:
+        # Icons are normally direct children; only then search the subtree
+        img = td.find("img", recursive=False) or td.find("img")
+    return _Cell(
+        classes=classes,
+        text=_bs4_text(td),
+        onmouseover=attrs.get("onmouseover", ""),
+        img_src=(img.attrs.get("src") or "") if img else None,
+    )
+
+
+def _parse_rows(rows: list[_Row], now: datetime) -> list[ForecastPeriod]:
     """
     Walk every <tr> in <tbody>.
 
     Date context comes from <th class='naptar'> cells (which have rowspan).
-    Each data row contributes one ForecastPeriod.
+    Each data row contributes one ForecastPeriod. ``now`` is read once per
+    scrape by the caller and used for all date decisions.
     """
     periods: list[ForecastPeriod] = []
     current_date: date | None = None
-    year = datetime.now().year
+    today = now.date()
 
-    for tr in tbody.find_all("tr", recursive=False):
+    for row in rows:
         # Check for a date header cell in this row
-        naptar = tr.find("th", class_="naptar")
-        if naptar:
-            current_date = _parse_naptar(naptar, year)
-
-        # The time cell tells us this is a data row
-        ora_td = tr.find("td", class_="ora")
-        if ora_td is None:
-            continue  # header-only row, skip
+        if row.naptar is not None:
+            current_date = _parse_naptar(row.naptar, now)
 
-        period = _parse_data_row(tr, current_date, year)
+        period = _parse_data_row(row.cells, current_date or today)
         if period is not None:
             periods.append(period)
 
     return periods
 
 
-def _parse_naptar(th: Tag, year: int) -> date | None:
+def _parse_naptar(divs: list[str], now: datetime) -> date | None:
     """
-    Parse a <th class='naptar'> cell.
+    Parse the <div> texts of a <th class='naptar'> cell.
 
     Structure:
         <th class='naptar' rowspan=N>
@@ -333,27 +644,51 @@ def _parse_naptar(th: Tag, year: int) -> date | None:
             <div>szerda</div>
         </th>
     """
-    divs = [d.get_text(strip=True) for d in th.find_all("div")]
     if len(divs) < 2:
         return None
 
-    month_hu = divs[0].lower()
+    month_hu = divs[0]
     day_str  = divs[1]
 
-    month = HU_MONTHS.get(month_hu)
+    # Exact match first; only fold case when that misses
+    month = HU_MONTHS.get(month_hu) or _HU_MONTHS_CI.get(month_hu.casefold())
     if month is None:
         return None
     try:
         day = int(day_str)
-        # Handle year rollover (December→January)
-        if month < datetime.now().month - 1:
-            year += 1
-        return date(year, month, day)
     except ValueError:
         return None
 
+    # The header has no year: take the candidate closest to today, which
+    # handles the rollover in both directions (December→January and back)
+    today = now.date()
+    best: date | None = None
+    for year in (now.year - 1, now.year, now.year + 1):
+        try:
+            d = date(year, month, day)
+        except ValueError:
+            continue  # e.g. 29 February outside a leap year
+        if best is None or abs(d - today) < abs(best - today):
+            best = d
+    return best
+
+
+# CSS classes that identify a cell's column; a cell goes to its first match
+_CELL_CLASSES = frozenset({"ora", "T", "R", "idoikon", "C", "Wikon", "Wd", "Wf", "P"})
+
 
-def _parse_data_row(tr: Tag, current_date: date | None, year: int) -> ForecastPeriod | None:
+def _classify_cells(cells: list[_Cell]) -> dict[str, list[_Cell]]:
+    """Bucket a row's cells by column class, in document order."""
+    by_class: dict[str, list[_Cell]] = {}
+    for cell in cells:
+        for css_class in cell.classes:
+            if css_class in _CELL_CLASSES:
+                by_class.setdefault(css_class, []).append(cell)
+                break
+    return by_class
+
+
+def _parse_data_row(cells: list[_Cell], current_date: date) -> ForecastPeriod | None:
     """
     Parse a single data row into a ForecastPeriod.
 
@@ -370,78 +705,78 @@ def _parse_data_row(tr: Tag, current_date: date | None, year: int) -> ForecastPe
       9  td.Wf       — wind speed km/h
       10 td.Wf       — wind gust km/h
       11 td.P        — pressure hPa
+
+    Returns None for rows without a time cell (header-only rows).
     """
-    p = ForecastPeriod()
+    # We use CSS classes to find cells reliably instead of positional indexing
+    # because the naptar th may or may not be in this row.
+    by_class = _classify_cells(cells)
 
     # --- time ---
-    ora = tr.find("td", class_="ora")
-    if ora is None:
+    # The time cell tells us this is a data row
+    ora = by_class.get("ora")
+    if not ora:
         return None
-    p.forecast_time = _parse_time(ora.get_text(strip=True), current_date, year)
 
-    tds = tr.find_all("td")
-    # Build an index skipping the ora cell for the rest
-    # We use CSS classes to find cells reliably instead of positional indexing
-    # because the naptar th may or may not be in this row.
+    p = ForecastPeriod()
+    p.forecast_time = _parse_time(ora[0].text, current_date)
+    p.stamp_iso()
 
     # --- min/max + temperature ---
-    t_cells = tr.find_all("td", class_="T")
-    for td in t_cells:
-        classes = td.get("class", [])
-        raw = td.get_text(strip=True)
-        val = _parse_float(raw)
-        if "X" in classes:
+    for td in by_class.get("T", ()):
+        val = _parse_float(td.text)
+        if "X" in td.classes:
             p.temperature_max = val
-        elif "N" in classes:
+        elif "N" in td.classes:
             p.temperature_min = val
         else:
             p.temperature = val
 
     # --- precipitation ---
-    r_td = tr.find("td", class_="R")
-    if r_td:
-        p.precipitation = _parse_float(r_td.get_text(strip=True))
+    r_tds = by_class.get("R")
+    if r_tds:
+        p.precipitation = _parse_float(r_tds[0].text)
 
     # --- cloud cover ---
-    c_td = tr.find("td", class_="C")
-    if c_td:
-        val = _parse_float(c_td.get_text(strip=True))
+    c_tds = by_class.get("C")
+    if c_tds:
+        val = _parse_float(c_tds[0].text)
         if val is not None:
             p.cloud_cover = int(val)
 
     # --- weather icon + description ---
     # The icon cell has class 'idoikon' and a non-spacer img src
-    for ikon_td in tr.find_all("td", class_="idoikon"):
-        img = ikon_td.find("img")
-        if img and "spacer" not in (img.get("src") or ""):
-            src = img.get("src", "")
+    for ikon_td in by_class.get("idoikon", ()):
+        src = ikon_td.img_src
+        if src is not None and "spacer" not in src:
             p.weather_condition  = _icon_src_to_condition(src)
-            p.weather_description = _extract_tooltip_description(ikon_td)
+            p.ha_condition       = to_ha_condition(p.weather_condition)
+            p.weather_description = _extract_tooltip_description(ikon_td.onmouseover)
             if p.weather_condition == 'exceptional':
                 _LOGGER.warning("No icon_condition found for %s, description is %s", src, p.weather_description)
             break
 
     # --- wind direction (degrees from tooltip) ---
-    wikon_td = tr.find("td", class_="Wikon")
-    if wikon_td:
-        p.wind_bearing = _extract_wind_degrees(wikon_td)
+    wikon_tds = by_class.get("Wikon")
+    if wikon_tds:
+        p.wind_bearing = _extract_wind_degrees(wikon_tds[0].onmouseover)
 
     # --- wind direction (text) ---
-    wd_td = tr.find("td", class_="Wd")
-    if wd_td:
-        p.wind_direction = _hu_wind_to_abbrev(wd_td.get_text(strip=True))
+    wd_tds = by_class.get("Wd")
+    if wd_tds:
+        p.wind_direction = _hu_wind_to_abbrev(wd_tds[0].text)
 
     # --- wind speed and gust (both share class Wf) ---
-    wf_tds = tr.find_all("td", class_="Wf")
+    wf_tds = by_class.get("Wf", ())
     if len(wf_tds) >= 1:
-        p.wind_speed = _parse_float(wf_tds[0].get_text(strip=True))
+        p.wind_speed = _parse_float(wf_tds[0].text)
     if len(wf_tds) >= 2:
-        p.wind_gust  = _parse_float(wf_tds[1].get_text(strip=True))
+        p.wind_gust  = _parse_float(wf_tds[1].text)
 
     # --- pressure ---
-    p_td = tr.find("td", class_="P")
-    if p_td:
-        p.pressure = _parse_float(p_td.get_text(strip=True))
+    p_tds = by_class.get("P")
+    if p_tds:
+        p.pressure = _parse_float(p_tds[0].text)
 
     return p
 
@@ -450,16 +785,24 @@ def _parse_data_row(tr: Tag, current_date: date | None, year: int) -> ForecastPe
 # Helper parsers
 # ---------------------------------------------------------------------------
 
-def _parse_time(text: str, d: date | None, year: int) -> datetime | None:
+def _parse_time(text: str, d: date) -> datetime | None:
     """Parse "HH:MM" into a datetime combined with the current date context."""
-    m = re.match(r"(\d{1,2}):(\d{2})", text.strip())
+    return _slot_datetime(d, text.strip())
+
+
+@lru_cache(maxsize=256)
+def _slot_datetime(d: date, hhmm: str) -> datetime | None:
+    """
+    Combine a date with an "HH:MM" time string.
+
+    All settlements share the same forecast slots, so each (day, time)
+    pair is parsed and constructed once and then reused.
+    """
+    m = _RE_TIME.match(hhmm)
     if not m:
         return None
-    hour, minute = int(m.group(1)), int(m.group(2))
-    if d is None:
-        d = date.today()
     try:
-        return datetime(d.year, d.month, d.day, hour, minute)
+        return datetime(d.year, d.month, d.day, int(m.group(1)), int(m.group(2)))
     except ValueError:
         return None
 
@@ -468,59 +811,72 @@ def _parse_float(text: str) -> float | None:
     """Extract a float from a cell's text, tolerating &nbsp; and minus variants."""
     if not text:
         return None
-    text = (
-        text
-        .replace("\xa0", "")   # non-breaking space
-        .replace("−", "-")     # unicode minus
-        .replace("–", "-")
-        .strip()
-    )
+    # Drop non-breaking spaces and normalize unicode minus/dash in one pass
+    text = text.translate(_FLOAT_TRANS).strip()
+    if not text:
+        return None  # blank (&nbsp;) cells are common, e.g. the min/max column
     # Handle "-0" which appears in the data
-    text = re.sub(r"^-0$", "0", text)
-    m = re.search(r"-?\d+\.?\d*", text)
-    if m:
-        try:
-            return float(m.group())
-        except ValueError:
-            pass
-    return None
-
-
+    if text == "-0":
+        return 0.0
+    # Plain decimal cells (the common case) need no search; float() alone
+    # would also accept "nan", "-inf", "1e3" and "1_000"
+    if _RE_DECIMAL.fullmatch(text):
+        value = float(text)
+    else:
+        m = _RE_FLOAT.search(text)
+        if not m:
+            return None
+        value = float(m.group())
+    return value if math.isfinite(value) else None
+
+
+@lru_cache(maxsize=64)
 def _icon_src_to_condition(src: str) -> str:
     """
     Map an icon src like '/images/idokepf24x/w002e.png' to an HA condition.
     Extracts the code (e.g. 'w002e') and looks it up in ICON_CONDITION.
+
+    The same few dozen icons recur on every page, so results are memoized.
     """
-    m = re.search(r"/(w\d+e?)\.(?:png|gif|jpg)", src, re.I)
+    # Fast path for met.hu's plain "/images/.../<code>.png" names. It only
+    # answers where _RE_ICON's first match is that same last path segment,
+    # so anything unusual gets the regex's answer
+    head, sep, tail = src.rpartition("/")
+    code, _, ext = tail.partition(".")
+    if sep and ext.lower() in _ICON_EXTS and "/w" not in head.lower():
+        condition = ICON_CONDITION.get(code)
+        if condition is not None:
+            return condition
+
+    m = _RE_ICON.search(src)
     if m:
-        code = m.group(1).lower()
-        if code in ICON_CONDITION:
-            return ICON_CONDITION[code]
+        code = m.group(1)
+        condition = ICON_CONDITION.get(code) or ICON_CONDITION.get(code.lower())
+        if condition is not None:
+            return condition
     return "exceptional"
 
 
-def _extract_tooltip_description(td: Tag) -> str | None:
+def _extract_tooltip_description(mo: str) -> str | None:
     """
     Extract the human-readable weather description from the onmouseover tooltip.
 
     The tooltip JS looks like:
         Tip('<div class=title>...<div class=ktext>kissé felhős</div>...')
     """
-    mo = td.get("onmouseover", "")
-    m = re.search(r"class=ktext>([^<]+)<", mo)
+    m = _RE_KTEXT.search(mo)
     if m:
         return m.group(1).strip()
     return None
 
 
-def _extract_wind_degrees(td: Tag) -> float | None:
+def _extract_wind_degrees(mo: str) -> float | None:
     """
     Extract exact wind bearing in degrees from the onmouseover tooltip.
 
     Tooltip text: "északkeleti\n(341 fok)"
     """
-    mo = td.get("onmouseover", "")
-    m = re.search(r"\((\d+)\s*fok\)", mo)
+    m = _RE_FOK.search(mo)
     if m:
         try:
             return float(m.group(1))
@@ -529,83 +885,117 @@ def _extract_wind_degrees(td: Tag) -> float | None:
     return None
 
 
+def to_ha_condition(condition: str | None) -> str:
+    """Map a scraped condition to one Home Assistant accepts."""
+    return condition if condition in VALID_HA_CONDITIONS else "exceptional"
+
+
+@lru_cache(maxsize=64)
 def _hu_wind_to_abbrev(text: str) -> str | None:
     """Convert a Hungarian wind direction name to a compass abbreviation."""
-    key = text.lower().strip()
-    return HU_WIND_DIR.get(key, text or None)
+    abbrev = HU_WIND_DIR.get(text)
+    if abbrev is not None:
+        return abbrev
+    # Cell text is already stripped by the row extractors
+    return _HU_WIND_DIR_CI.get(text.casefold(), text or None)
 
 
 # ---------------------------------------------------------------------------
 # Daily aggregation
 # ---------------------------------------------------------------------------
 
-def _find_current(periods: list[ForecastPeriod]) -> ForecastPeriod | None:
+def _find_current(
+    periods: list[ForecastPeriod], now: datetime
+) -> ForecastPeriod | None:
     """Return the period closest to now (first future or last past).
        met.hu provides updates per 6 hours, so we subtract 3 hours from now"""
-    now = datetime.now() - timedelta(hours=3)
-    future = [p for p in periods if p.forecast_time and p.forecast_time >= now]
-    if future:
-        return future[0]
+    now -= timedelta(hours=3)
+    # Periods are in table (time) order, so the first hit is the answer
+    for p in periods:
+        if p.forecast_time and p.forecast_time >= now:
+            return p
     return periods[-1] if periods else None
 
 
 def _aggregate_daily(periods: list[ForecastPeriod]) -> list[ForecastPeriod]:
     """Aggregate per-slot periods into one summary ForecastPeriod per calendar day."""
-    from collections import defaultdict
-
-    groups: dict[str, list[ForecastPeriod]] = defaultdict(list)
+    groups: dict[tuple[int, int, int] | None, list[ForecastPeriod]] = defaultdict(list)
     for p in periods:
-        key = p.forecast_time.strftime("%Y-%m-%d") if p.forecast_time else "unknown"
+        t = p.forecast_time
+        key = (t.year, t.month, t.day) if t else None
         groups[key].append(p)
 
-    daily: list[ForecastPeriod] = []
-    for key, day_periods in groups.items():
-        s = ForecastPeriod()
-
-        # Anchor daily period to noon
-        if day_periods[0].forecast_time:
-            s.forecast_time = day_periods[0].forecast_time.replace(
-                hour=12, minute=0, second=0, microsecond=0
-            )
-
-        temps = [p.temperature for p in day_periods if p.temperature is not None]
-        if temps:
-            s.temperature     = round(sum(temps) / len(temps), 1)
-            s.temperature_min = min(temps)
-            s.temperature_max = max(temps)
-
-        # Prefer explicit min/max markers if present
-        explicit_min = [p.temperature_min for p in day_periods if p.temperature_min is not None]
-        explicit_max = [p.temperature_max for p in day_periods if p.temperature_max is not None]
-        if explicit_min:
-            s.temperature_min = min(explicit_min)
-        if explicit_max:
-            s.temperature_max = max(explicit_max)
-
-        precips = [p.precipitation for p in day_periods if p.precipitation is not None]
-        if precips:
-            s.precipitation = round(sum(precips), 1)
-
-        winds = [p.wind_speed for p in day_periods if p.wind_speed is not None]
-        if winds:
-            s.wind_speed = max(winds)
-
-        gusts = [p.wind_gust for p in day_periods if p.wind_gust is not None]
-        if gusts:
-            s.wind_gust = max(gusts)
-
-        pressures = [p.pressure for p in day_periods if p.pressure is not None]
-        if pressures:
-            s.pressure = round(sum(pressures) / len(pressures), 1)
-
-        # Use the midday (or nearest) slot for condition, direction, cloud cover
-        mid = day_periods[len(day_periods) // 2]
-        s.weather_condition   = mid.weather_condition
-        s.weather_description = mid.weather_description
-        s.wind_direction      = mid.wind_direction
-        s.wind_bearing        = mid.wind_bearing
-        s.cloud_cover         = mid.cloud_cover
-
-        daily.append(s)
-
-    return daily
+    return [_summarize_day(day_periods) for day_periods in groups.values()]
+
+
+def _summarize_day(day_periods: list[ForecastPeriod]) -> ForecastPeriod:
+    """Summarize one calendar day's slots into a single ForecastPeriod."""
+    s = ForecastPeriod()
+
+    # Anchor daily period to noon
+    if day_periods[0].forecast_time:
+        s.forecast_time = day_periods[0].forecast_time.replace(
+            hour=12, minute=0, second=0, microsecond=0
+        )
+        s.stamp_iso()
+
+    # One pass over the day's slots, folding every statistic at once
+    t_sum = p_sum = pr_sum = 0.0
+    t_cnt = p_cnt = pr_cnt = 0
+    t_min = t_max = em_min = em_max = w_max = g_max = None
+    for p in day_periods:
+        v = p.temperature
+        if v is not None:
+            t_sum += v
+            t_cnt += 1
+            t_min = v if t_min is None or v < t_min else t_min
+            t_max = v if t_max is None or v > t_max else t_max
+        v = p.temperature_min
+        if v is not None:
+            em_min = v if em_min is None or v < em_min else em_min
+        v = p.temperature_max
+        if v is not None:
+            em_max = v if em_max is None or v > em_max else em_max
+        v = p.precipitation
+        if v is not None:
+            p_sum += v
+            p_cnt += 1
+        v = p.wind_speed
+        if v is not None:
+            w_max = v if w_max is None or v > w_max else w_max
+        v = p.wind_gust
+        if v is not None:
+            g_max = v if g_max is None or v > g_max else g_max
+        v = p.pressure
+        if v is not None:
+            pr_sum += v
+            pr_cnt += 1
+
+    if t_cnt:
+        s.temperature     = round(t_sum / t_cnt, 1)
+        s.temperature_min = t_min
+        s.temperature_max = t_max
+
+    # Prefer explicit min/max markers if present
+    if em_min is not None:
+        s.temperature_min = em_min
+    if em_max is not None:
+        s.temperature_max = em_max
+
+    if p_cnt:
+        s.precipitation = round(p_sum, 1)
+    s.wind_speed = w_max
+    s.wind_gust  = g_max
+    if pr_cnt:
+        s.pressure = round(pr_sum / pr_cnt, 1)
+
+    # Use the midday (or nearest) slot for condition, direction, cloud cover
+    mid = day_periods[len(day_periods) // 2]
+    s.weather_condition   = mid.weather_condition
+    s.ha_condition        = mid.ha_condition
+    s.weather_description = mid.weather_description
+    s.wind_direction      = mid.wind_direction
+    s.wind_bearing        = mid.wind_bearing
+    s.cloud_cover         = mid.cloud_cover
+
+    return s
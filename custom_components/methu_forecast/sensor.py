@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -10,7 +11,6 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     PERCENTAGE,
     UnitOfPressure,
@@ -18,13 +18,12 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfPrecipitationDepth,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MetHuForecastCoordinator
+from .coordinator import MetHuConfigEntry, MetHuForecastCoordinator
 from .scraper import ForecastPeriod, MetHuForecastData
 
 _LOGGER = logging.getLogger(__name__)
@@ -118,92 +117,98 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+# sensor key → C-level getter for that ForecastPeriod field
+_GETTERS = {d.key: attrgetter(d.key) for d in SENSOR_DESCRIPTIONS}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: MetHuConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up sensor entities."""
-    coordinator: MetHuForecastCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     settlement_name = coordinator.settlement.name
 
     async_add_entities(
-        MetHuForecastSensor(coordinator, entry, description, settlement_name)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            MetHuForecastSensor(coordinator, description, settlement_name)
+            for description in SENSOR_DESCRIPTIONS
+        ]
     )
 
 
 class MetHuForecastSensor(CoordinatorEntity[MetHuForecastCoordinator], SensorEntity):
     """A single met.hu forecast sensor."""
 
+    __slots__ = ("_settlement", "_getter", "_attr_cache", "_current")
+
     entity_description: SensorEntityDescription
 
     def __init__(
         self,
         coordinator: MetHuForecastCoordinator,
-        entry: ConfigEntry,
         description: SensorEntityDescription,
         settlement: str,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
         self._settlement = settlement
+        self._getter = _GETTERS[description.key]
+        # (data the attributes were built from, attributes)
+        self._attr_cache: tuple[MetHuForecastData | None, dict[str, Any]] | None = None
+        # Current period, snapshotted whenever the coordinator data changes
+        self._current: ForecastPeriod | None = None
 
-        slug = settlement.lower().replace(" ", "_").replace("-", "_")
-        self._attr_unique_id = f"{DOMAIN}_{slug}_{description.key}"
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slug}_{description.key}"
         self._attr_name = f"{settlement} {description.name}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"HungaroMet: {settlement}",
-            manufacturer="HungaroMet",
-            model="met.hu Forecast",
-            entry_type="service",
-            configuration_url=(
-                "https://www.met.hu/idojaras/elorejelzes/magyarorszagi_telepulesek/"
-            ),
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
-        if not self.coordinator.data or not self.coordinator.data.current:
-            return None
-        return getattr(self.coordinator.data.current, self.entity_description.key, None)
+        current = self._current
+        return self._getter(current) if current else None
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        data = self.coordinator.data
+        self._current = data.current if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
+        self._current = data.current if data else None
+        self._attr_cache = None
+        super()._handle_coordinator_update()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        attrs: dict[str, Any] = {"settlement": self._settlement}
         data: MetHuForecastData | None = self.coordinator.data
+        cache = self._attr_cache
+        if cache is not None and cache[0] is data:
+            return cache[1]
+        attrs = self._build_attributes(data)
+        self._attr_cache = (data, attrs)
+        return attrs
+
+    def _build_attributes(self, data: MetHuForecastData | None) -> dict[str, Any]:
+        attrs: dict[str, Any] = {"settlement": self._settlement}
         if not data:
             return attrs
 
-        key = self.entity_description.key
-
-        if data.current and data.current.forecast_time:
-            attrs["forecast_time"] = data.current.forecast_time.isoformat()
+        if data.current and data.current.time_iso:
+            attrs["forecast_time"] = data.current.time_iso
 
+        # Built once per update by the coordinator and shared by all sensors
+        hourly, daily = self.coordinator.forecast_series(self.entity_description.key)
         if data.hourly:
-            attrs["hourly_forecast"] = [
-                {
-                    "time": p.forecast_time.isoformat() if p.forecast_time else None,
-                    "value": getattr(p, key, None),
-                }
-                for p in data.hourly
-                if getattr(p, key, None) is not None
-            ]
-
+            attrs["hourly_forecast"] = hourly
         if data.daily:
-            attrs["daily_forecast"] = [
-                {
-                    "date": p.forecast_time.date().isoformat() if p.forecast_time else None,
-                    "value": getattr(p, key, None),
-                }
-                for p in data.daily
-                if getattr(p, key, None) is not None
-            ]
-
-        if data.last_updated:
-            attrs["last_updated"] = data.last_updated.isoformat()
+            attrs["daily_forecast"] = daily
+
+        last_updated = self.coordinator.last_updated_iso
+        if last_updated:
+            attrs["last_updated"] = last_updated
 
         return attrs
 
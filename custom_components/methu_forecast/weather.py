@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import logging
+from itertools import chain
+from operator import attrgetter
 from typing import Any
 
 from homeassistant.components.weather import (
@@ -9,77 +11,64 @@ from homeassistant.components.weather import (
     WeatherEntity,
     WeatherEntityFeature,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     UnitOfPrecipitationDepth,
     UnitOfPressure,
     UnitOfSpeed,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MetHuForecastCoordinator
+from .coordinator import MetHuConfigEntry, MetHuForecastCoordinator
 from .scraper import ForecastPeriod, MetHuForecastData
 
 _LOGGER = logging.getLogger(__name__)
 
-# Our internal condition strings are already valid HA condition strings
-# (sunny, partlycloudy, cloudy, rainy, snowy, etc.) — pass through directly.
-VALID_HA_CONDITIONS = {
-    "clear-night", "cloudy", "exceptional", "fog", "hail", "lightning",
-    "lightning-rainy", "partlycloudy", "pouring", "rainy", "snowy",
-    "snowy-rainy", "sunny", "windy", "windy-variant",
-}
-
-
-def _to_ha_condition(condition: str | None) -> str | None:
-    if condition in VALID_HA_CONDITIONS:
-        return condition
-    return "exceptional"
+# Forecast key → ForecastPeriod field, for the values copied as they are
+_FORECAST_FIELDS = (
+    ("templow", "temperature_min"),
+    ("precipitation", "precipitation"),
+    ("wind_speed", "wind_speed"),
+    ("wind_bearing", "wind_bearing"),
+    ("cloud_coverage", "cloud_cover"),
+    ("pressure", "pressure"),
+)
+_FORECAST_KEYS = tuple(key for key, _ in _FORECAST_FIELDS)
+# Reads all of the above from a period in one call
+_forecast_values = attrgetter(*(name for _, name in _FORECAST_FIELDS))
 
 
 def _period_to_forecast(p: ForecastPeriod) -> Forecast:
-    fc: Forecast = {}
-    if p.forecast_time:
-        fc["datetime"] = p.forecast_time.isoformat()
-    fc["condition"] = _to_ha_condition(p.weather_condition)
-    if p.temperature_max is not None:
-        fc["temperature"] = p.temperature_max
-    elif p.temperature is not None:
-        fc["temperature"] = p.temperature
-    if p.temperature_min is not None:
-        fc["templow"] = p.temperature_min
-    if p.precipitation is not None:
-        fc["precipitation"] = p.precipitation
-    if p.wind_speed is not None:
-        fc["wind_speed"] = p.wind_speed
-    if p.wind_bearing is not None:
-        fc["wind_bearing"] = p.wind_bearing
-    if p.cloud_cover is not None:
-        fc["cloud_coverage"] = p.cloud_cover
-    if p.pressure is not None:
-        fc["pressure"] = p.pressure
-    return fc
+    # condition always has a value ("exceptional" at worst); the rest is
+    # left out when met.hu gave nothing
+    head = (
+        ("datetime", p.time_iso),
+        ("condition", p.ha_condition),
+        ("temperature", p.temperature if p.temperature_max is None else p.temperature_max),
+    )
+    items = chain(head, zip(_FORECAST_KEYS, _forecast_values(p)))
+    return {k: v for k, v in items if v is not None}
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: MetHuConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: MetHuForecastCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     async_add_entities(
-        [MetHuWeatherEntity(coordinator, entry, coordinator.settlement.name)]
+        [MetHuWeatherEntity(coordinator, coordinator.settlement.name)]
     )
 
 
 class MetHuWeatherEntity(CoordinatorEntity[MetHuForecastCoordinator], WeatherEntity):
     """Weather entity backed by met.hu forecast data."""
 
+    __slots__ = ("_settlement", "_current")
+
     _attr_attribution = "Weather data © HungaroMet (met.hu)"
     _attr_native_temperature_unit      = UnitOfTemperature.CELSIUS
     _attr_native_precipitation_unit    = UnitOfPrecipitationDepth.MILLIMETERS
@@ -92,32 +81,32 @@ class MetHuWeatherEntity(CoordinatorEntity[MetHuForecastCoordinator], WeatherEnt
     def __init__(
         self,
         coordinator: MetHuForecastCoordinator,
-        entry: ConfigEntry,
         settlement: str,
     ) -> None:
         super().__init__(coordinator)
         self._settlement = settlement
-        slug = settlement.lower().replace(" ", "_").replace("-", "_")
-        self._attr_unique_id = f"{DOMAIN}_{slug}_weather"
+        # Current period, snapshotted whenever the coordinator data changes
+        self._current: ForecastPeriod | None = None
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.slug}_weather"
         self._attr_name = f"HungaroMet {settlement}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"HungaroMet: {settlement}",
-            manufacturer="HungaroMet",
-            model="met.hu Forecast",
-            entry_type="service",
-            configuration_url=(
-                "https://www.met.hu/idojaras/elorejelzes/magyarorszagi_telepulesek/"
-            ),
-        )
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def _current(self) -> ForecastPeriod | None:
-        return self.coordinator.data.current if self.coordinator.data else None
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        data = self.coordinator.data
+        self._current = data.current if data else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
+        self._current = data.current if data else None
+        super()._handle_coordinator_update()
 
     @property
     def condition(self) -> str | None:
-        return _to_ha_condition(self._current.weather_condition if self._current else None)
+        # Our condition strings are already HA ones; the scraper resolved
+        # anything else to "exceptional"
+        return self._current.ha_condition if self._current else "exceptional"
 
     @property
     def native_temperature(self) -> float | None:
@@ -146,14 +135,18 @@ class MetHuWeatherEntity(CoordinatorEntity[MetHuForecastCoordinator], WeatherEnt
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         attrs: dict[str, Any] = {"settlement": self._settlement}
-        if self.coordinator.data and self.coordinator.data.last_updated:
-            attrs["last_updated"] = self.coordinator.data.last_updated.isoformat()
-        if self._current and self._current.weather_description:
-            attrs["weather_description_hu"] = self._current.weather_description
-        if self._current and self._current.wind_gust is not None:
-            attrs["wind_gust_kmh"] = self._current.wind_gust
-        if self._current and self._current.wind_direction:
-            attrs["wind_direction"] = self._current.wind_direction
+        last_updated = self.coordinator.last_updated_iso
+        if last_updated:
+            attrs["last_updated"] = last_updated
+        current = self._current
+        if current is None:
+            return attrs
+        if current.weather_description:
+            attrs["weather_description_hu"] = current.weather_description
+        if current.wind_gust is not None:
+            attrs["wind_gust_kmh"] = current.wind_gust
+        if current.wind_direction:
+            attrs["wind_direction"] = current.wind_direction
         return attrs
 
     @property
@@ -161,11 +154,15 @@ class MetHuWeatherEntity(CoordinatorEntity[MetHuForecastCoordinator], WeatherEnt
         return self.coordinator.last_update_success and self.coordinator.data is not None
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return [_period_to_forecast(p) for p in self.coordinator.data.daily]
+        to_forecast = _period_to_forecast
+        return [to_forecast(p) for p in data.daily]
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
-        return [_period_to_forecast(p) for p in self.coordinator.data.hourly]
+        to_forecast = _period_to_forecast
+        return [to_forecast(p) for p in data.hourly]